@@ -1,57 +1,110 @@
 from __future__ import annotations
 
+import mmap
 import os
+import re
+import string
 import sys
 import time
 import textwrap
 
 from src.trie import Trie
+from src.marisa_backend import MARISA_AVAILABLE, MarisaTrie
 
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 DEFAULT_WORDS_FILE = os.path.join(DATA_DIR, "words.txt")
 
+# fallback set if no word file is present
+_FALLBACK_WORDS = [
+    "app", "apple", "apples", "application", "applied", "apply",
+    "applet", "apt",
+    "banana", "band", "bandit", "bandwidth",
+    "bat", "batch", "bath",
+    "cat", "catch", "cater",
+    "dog", "dove", "doom",
+]
+
+# Precompiled A-Z -> a-z table; translate() with it avoids the generic
+# (locale-aware) str.lower machinery on every command round-trip.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Same idea for the byte side: a 256-entry table mapping A-Z to a-z and
+# everything else to itself, applied to the whole word file in one
+# translate() call.
+_LOWER = bytes.maketrans(
+    bytes(range(ord("A"), ord("Z") + 1)),
+    bytes(range(ord("a"), ord("z") + 1)),
+)
+
+
+def _read_word_bytes(path: str) -> list[bytes] | None:
+    """Read a word file as lowercased byte lines; None if path is missing."""
+    if not os.path.exists(path):
+        return None
+    if os.path.getsize(path) == 0:
+        return []
+    # Map the whole file and lowercase it with one table-driven
+    # translate; splitting the buffer yields every word without
+    # per-line Python I/O.
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            data = buf[:].translate(_LOWER)
+    return data.split(b"\n")
+
 
 def load_words(trie: Trie, path: str) -> int:
     """Load words from a text file (one word per line) into the Trie."""
-    if not os.path.exists(path):
-        # fallback set if no file is present
-        fallback = [
-            "app", "apple", "apples", "application", "applied", "apply",
-            "applet", "apt",
-            "banana", "band", "bandit", "bandwidth",
-            "bat", "batch", "bath",
-            "cat", "catch", "cater",
-            "dog", "dove", "doom",
-        ]
-        for w in fallback:
+    lines = _read_word_bytes(path)
+    if lines is None:
+        for w in _FALLBACK_WORDS:
             trie.insert(w)
-        return len(fallback)
+        return len(_FALLBACK_WORDS)
+    return trie.insert_many(lines)
 
-    count = 0
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            word = line.strip().lower()
-            if word:
-                trie.insert(word)
-                count += 1
-    return count
+
+def load_word_strings(path: str) -> list[str]:
+    """Like load_words, but return the word list itself. Used by backends
+    (e.g. marisa) that are built from a word list in one shot."""
+    lines = _read_word_bytes(path)
+    if lines is None:
+        return list(_FALLBACK_WORDS)
+    return [w.decode("utf-8") for w in (line.strip() for line in lines) if w]
 
 
 def collect_all_words(trie: Trie) -> list[str]:
     """Collect all words in the Trie (used for linear search comparison)."""
+    if isinstance(trie, MarisaTrie):
+        return trie.get_words_with_prefix("")
+
     results: list[str] = []
+    children = trie._children  # type: ignore[attr-defined]
+    is_end = trie._is_end  # type: ignore[attr-defined]
+
+    buf = bytearray(max(trie._max_len, 1))  # type: ignore[attr-defined]
+    stack: list[tuple] = [(0, 0, None)]
+    while stack:
+        node, depth, c = stack.pop()
+        if c is not None:
+            buf[depth - 1] = c
+        if is_end[node]:
+            results.append(buf[:depth].decode("utf-8"))
+        for c2, child in reversed(children[node].items()):
+            stack.append((child, depth + 1, c2))
+    return results
 
-    def dfs(node, path: list[str]) -> None:
-        if node.is_end:
-            results.append("".join(path))
-        for ch, child in node.children.items():
-            path.append(ch)
-            dfs(child, path)
-            path.pop()
 
-    dfs(trie._root, [])  # type: ignore[attr-defined]
-    return results
+# Memoized newline-joined word blob for the compare command, keyed on
+# the trie identity and its mutation counter.
+_words_blob_cache: tuple | None = None
+
+
+def _words_blob(trie: Trie) -> str:
+    global _words_blob_cache
+    key = (id(trie), trie._version)  # type: ignore[attr-defined]
+    if _words_blob_cache is None or _words_blob_cache[0] != key:
+        _words_blob_cache = (key, "\n".join(collect_all_words(trie)))
+    return _words_blob_cache[1]
 
 
 def print_help() -> None:
@@ -71,15 +124,143 @@ def print_help() -> None:
     print(help_text)
 
 
-def main() -> None:
-    trie = Trie()
+def _parse_limit(args: list[str]) -> int:
+    limit = 10
+    if len(args) > 1:
+        try:
+            limit = int(args[1])
+        except ValueError:
+            print("Limit must be an integer; using default = 10.")
+    return limit
 
+
+def _cmd_help(trie: Trie, args: list[str]) -> None:
+    print_help()
+
+
+def _cmd_stats(trie: Trie, args: list[str]) -> None:
+    print(f"Words stored in trie: {trie.size()}")
+
+
+def _cmd_search(trie: Trie, args: list[str]) -> None:
+    if not args:
+        print("Usage: search <word>")
+        return
+    word = args[0].translate(_ASCII_LOWER)
+    print("YES" if trie.search(word) else "NO")
+
+
+def _cmd_prefix(trie: Trie, args: list[str]) -> None:
+    if not args:
+        print("Usage: prefix <prefix> [limit]")
+        return
+    prefix = args[0].translate(_ASCII_LOWER)
+    limit = _parse_limit(args)
+    matches = trie.get_words_with_prefix(prefix, limit=limit)
+    if not matches:
+        print("(no matches)")
+    else:
+        for w in matches:
+            print(" ", w)
+
+
+def _cmd_add(trie: Trie, args: list[str]) -> None:
+    if not args:
+        print("Usage: add <word>")
+        return
+    word = args[0].translate(_ASCII_LOWER)
+    try:
+        # one traversal instead of search-then-insert
+        added = trie.insert_returning_new(word)
+    except NotImplementedError as exc:
+        print(f"Not supported: {exc}")
+        return
+    if added:
+        print(f"Added '{word}'.")
+    else:
+        print(f"'{word}' was already present.")
+
+
+def _cmd_delete(trie: Trie, args: list[str]) -> None:
+    if not args:
+        print("Usage: delete <word>")
+        return
+    word = args[0].translate(_ASCII_LOWER)
+    try:
+        deleted = trie.delete(word)
+    except NotImplementedError as exc:
+        print(f"Not supported: {exc}")
+        return
+    if deleted:
+        print(f"Deleted '{word}'.")
+    else:
+        print(f"'{word}' not found.")
+
+
+def _cmd_compare(trie: Trie, args: list[str]) -> None:
+    if not args:
+        print("Usage: compare <prefix> [limit]")
+        return
+    prefix = args[0].translate(_ASCII_LOWER)
+    limit = _parse_limit(args)
+
+    # linear scan over all words, done by the regex engine in C over one
+    # newline-joined blob rather than a Python startswith loop
+    blob = _words_blob(trie)
+    pattern = re.compile(
+        r"^" + re.escape(prefix) + r"[^\n]*", re.MULTILINE
+    )
+
+    start = time.perf_counter()
+    linear_matches = pattern.findall(blob)
+    t_linear = time.perf_counter() - start
+
+    # trie-based search
+    start = time.perf_counter()
+    trie_matches = trie.get_words_with_prefix(prefix, limit=None)
+    t_trie = time.perf_counter() - start
+
+    print(f"Linear search found {len(linear_matches)} matches in {t_linear * 1e6:.1f} µs")
+    print(f"Trie search found   {len(trie_matches)} matches in {t_trie * 1e6:.1f} µs")
+    print(f"First {limit} trie matches:")
+    for w in trie_matches[:limit]:
+        print(" ", w)
+
+
+# O(1) command dispatch instead of an if/elif chain.
+HANDLERS = {
+    "help": _cmd_help,
+    "stats": _cmd_stats,
+    "search": _cmd_search,
+    "prefix": _cmd_prefix,
+    "add": _cmd_add,
+    "delete": _cmd_delete,
+    "compare": _cmd_compare,
+}
+
+
+def main() -> None:
     # Optional: allow a custom word list file via CLI arg
     words_file = DEFAULT_WORDS_FILE
     if len(sys.argv) > 1:
         words_file = sys.argv[1]
 
-    loaded = load_words(trie, words_file)
+    # TRIE_BACKEND=marisa swaps in the C-extension backend: far less
+    # memory on real word lists, but read-only after construction.
+    backend = os.environ.get("TRIE_BACKEND", "").strip().lower()
+    if backend == "marisa" and not MARISA_AVAILABLE:
+        print("marisa-trie is not installed; using the built-in trie.")
+        backend = ""
+
+    if backend == "marisa":
+        words = load_word_strings(words_file)
+        trie = MarisaTrie(words)
+        loaded = len(words)
+    else:
+        trie = Trie()
+        loaded = load_words(trie, words_file)
+        # one-time sort so prefix results come out in lexicographic order
+        trie.finalize_sort()
     source_label = os.path.basename(words_file) if os.path.exists(words_file) else "built-in list"
     print(f"Loaded {loaded} words (source: {source_label})")
     print("Trie Autocomplete Demo")
@@ -96,98 +277,18 @@ def main() -> None:
             continue
 
         parts = raw.split()
-        cmd = parts[0].lower()
+        cmd = parts[0].translate(_ASCII_LOWER)
         args = parts[1:]
 
         if cmd in ("quit", "exit", "q"):
             print("Bye.")
             break
 
-        elif cmd == "help":
-            print_help()
-
-        elif cmd == "stats":
-            print(f"Words stored in trie: {trie.size()}")
-
-        elif cmd == "search":
-            if not args:
-                print("Usage: search <word>")
-                continue
-            word = args[0].lower()
-            print("YES" if trie.search(word) else "NO")
-
-        elif cmd == "prefix":
-            if not args:
-                print("Usage: prefix <prefix> [limit]")
-                continue
-            prefix = args[0].lower()
-            limit = 10
-            if len(args) > 1:
-                try:
-                    limit = int(args[1])
-                except ValueError:
-                    print("Limit must be an integer; using default = 10.")
-            matches = trie.get_words_with_prefix(prefix, limit=limit)
-            if not matches:
-                print("(no matches)")
-            else:
-                for w in matches:
-                    print(" ", w)
-
-        elif cmd == "add":
-            if not args:
-                print("Usage: add <word>")
-                continue
-            word = args[0].lower()
-            existed = trie.search(word)
-            trie.insert(word)
-            if existed:
-                print(f"'{word}' was already present.")
-            else:
-                print(f"Added '{word}'.")
-
-        elif cmd == "delete":
-            if not args:
-                print("Usage: delete <word>")
-                continue
-            word = args[0].lower()
-            if trie.delete(word):
-                print(f"Deleted '{word}'.")
-            else:
-                print(f"'{word}' not found.")
-
-        elif cmd == "compare":
-            if not args:
-                print("Usage: compare <prefix> [limit]")
-                continue
-            prefix = args[0].lower()
-            limit = 10
-            if len(args) > 1:
-                try:
-                    limit = int(args[1])
-                except ValueError:
-                    print("Limit must be an integer; using default = 10.")
-
-            # linear search over all words
-            all_words = collect_all_words(trie)
-
-            start = time.perf_counter()
-            linear_matches = [w for w in all_words if w.startswith(prefix)]
-            t_linear = time.perf_counter() - start
-
-            # trie-based search
-            start = time.perf_counter()
-            trie_matches = trie.get_words_with_prefix(prefix, limit=None)
-            t_trie = time.perf_counter() - start
-
-            print(f"Linear search found {len(linear_matches)} matches in {t_linear * 1e6:.1f} µs")
-            print(f"Trie search found   {len(trie_matches)} matches in {t_trie * 1e6:.1f} µs")
-            print(f"First {limit} trie matches:")
-            for w in trie_matches[:limit]:
-                print(" ", w)
-
-        else:
+        handler = HANDLERS.get(cmd)
+        if handler is None:
             print("Unknown command. Type 'help'.")
+        else:
+            handler(trie, args)
 
 
 if __name__ == "__main__":
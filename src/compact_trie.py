@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+
+class CompactTrieNode:
+    """A node holding a whole substring, not a single character.
+
+    __slots__ drops the per-instance __dict__, shrinking each node and
+    turning attribute access into a fixed-offset load.
+    """
+
+    __slots__ = ("label", "children", "is_end")
+
+    def __init__(
+        self,
+        label: str = "",
+        children: Optional[List["CompactTrieNode"]] = None,
+        is_end: bool = False,
+    ) -> None:
+        self.label = label
+        self.children = children if children is not None else []
+        self.is_end = is_end
+
+
+def _child_slot(children: List[CompactTrieNode], ch: str) -> Tuple[int, bool]:
+    """Binary-search children (sorted by first label character) for ch.
+    Returns (index, found); index is the insertion point when not found.
+    """
+    lo, hi = 0, len(children)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if children[mid].label[0] < ch:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo, lo < len(children) and children[lo].label[0] == ch
+
+
+class CompactTrie:
+    """
+    Compact (radix / PATRICIA) Trie with the same interface as Trie.
+
+    Unary chains are collapsed into a single node carrying the whole
+    substring, so dictionaries dominated by long unique suffixes use far
+    fewer nodes than a per-character trie. Children are kept sorted by
+    first character and located by binary search, which also makes
+    get_words_with_prefix yield results in lexicographic order.
+    """
+
+    def __init__(self) -> None:
+        self._root = CompactTrieNode()
+        self._size = 0  # number of stored complete words
+
+    # ------------------------------------------------------
+    # Core public API
+    # ------------------------------------------------------
+
+    def insert(self, word: str) -> None:
+        """Insert a word into the Trie.
+        Time: O(m)
+        """
+        if not word:
+            return
+
+        node = self._root
+        i = 0
+        n = len(word)
+        while i < n:
+            pos, found = _child_slot(node.children, word[i])
+            if not found:
+                node.children.insert(
+                    pos, CompactTrieNode(word[i:], [], True)
+                )
+                self._size += 1
+                return
+
+            child = node.children[pos]
+            label = child.label
+            common = 0
+            max_common = min(len(label), n - i)
+            while common < max_common and label[common] == word[i + common]:
+                common += 1
+
+            if common < len(label):
+                # Partial label match: split child into a common-prefix
+                # parent and a tail node keeping the old subtree.
+                tail = CompactTrieNode(
+                    label[common:], child.children, child.is_end
+                )
+                child.label = label[:common]
+                child.children = [tail]
+                child.is_end = False
+
+            i += common
+            node = child
+
+        if not node.is_end:
+            node.is_end = True
+            self._size += 1
+
+    def search(self, word: str) -> bool:
+        """Return True if the word exists as a complete word.
+        Time: O(m)
+        """
+        hit = self._traverse(word)
+        return hit is not None and hit[1] == 0 and hit[0].is_end
+
+    def starts_with(self, prefix: str) -> bool:
+        """Return True if any stored word begins with the prefix.
+        Time: O(p)
+        """
+        return self._traverse(prefix) is not None
+
+    def get_words_with_prefix(
+        self, prefix: str, limit: Optional[int] = None
+    ) -> List[str]:
+        """Return words beginning with prefix, in lexicographic order.
+        Stops at limit if provided.
+        Time: O(p + k·L')
+        """
+        hit = self._traverse(prefix)
+        if hit is None:
+            return []
+        node, leftover = hit
+
+        results: List[str] = []
+        # Complete the partially matched label before descending.
+        start = prefix + node.label[len(node.label) - leftover:]
+        stack = [(node, start)]
+        while stack:
+            n, acc = stack.pop()
+            if n.is_end:
+                # Limit before append, so limit=0 returns [] like the
+                # other backends.
+                if limit is not None and len(results) >= limit:
+                    break
+                results.append(acc)
+            for child in reversed(n.children):
+                stack.append((child, acc + child.label))
+        return results
+
+    def delete(self, word: str) -> bool:
+        """Delete a word. Returns True if deleted.
+        Time: O(m)
+        """
+        if not word:
+            return False
+
+        # Walk down recording (parent, child index); the word must end
+        # exactly on a node boundary to be present.
+        node = self._root
+        path: List[Tuple[CompactTrieNode, int]] = []
+        i = 0
+        n = len(word)
+        while i < n:
+            pos, found = _child_slot(node.children, word[i])
+            if not found:
+                return False
+            child = node.children[pos]
+            if word[i:i + len(child.label)] != child.label:
+                return False
+            path.append((node, pos))
+            i += len(child.label)
+            node = child
+
+        if not node.is_end:
+            return False
+        node.is_end = False
+        self._size -= 1
+
+        if node.children:
+            self._maybe_merge(node)
+        elif path:
+            parent, pos = path[-1]
+            del parent.children[pos]
+            self._maybe_merge(parent)
+        return True
+
+    def count_prefix(self, prefix: str) -> int:
+        """Count how many stored words start with the prefix.
+        Time: O(p + T)
+        """
+        hit = self._traverse(prefix)
+        if hit is None:
+            return 0
+
+        count = 0
+        stack = [hit[0]]
+        while stack:
+            n = stack.pop()
+            if n.is_end:
+                count += 1
+            stack.extend(n.children)
+        return count
+
+    def size(self) -> int:
+        """Return number of stored words."""
+        return self._size
+
+    def is_empty(self) -> bool:
+        """Return True if Trie contains no words."""
+        return self._size == 0
+
+    # Pythonic convenience
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: str) -> bool:
+        return self.search(word)
+
+    # ------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------
+
+    def _traverse(
+        self, string: str
+    ) -> Optional[Tuple[CompactTrieNode, int]]:
+        """Return (node, leftover) at the end of string traversal, where
+        leftover is how much of node.label extends past the string, or
+        None if the path does not exist.
+        """
+        node = self._root
+        leftover = 0
+        i = 0
+        n = len(string)
+        while i < n:
+            pos, found = _child_slot(node.children, string[i])
+            if not found:
+                return None
+            child = node.children[pos]
+            label = child.label
+            k = min(len(label), n - i)
+            if label[:k] != string[i:i + k]:
+                return None
+            i += k
+            leftover = len(label) - k
+            node = child
+        return node, leftover
+
+    def _maybe_merge(self, node: CompactTrieNode) -> None:
+        """Fold node into its only child if it no longer branches."""
+        if node is self._root or node.is_end or len(node.children) != 1:
+            return
+        child = node.children[0]
+        node.label += child.label
+        node.is_end = child.is_end
+        node.children = child.children
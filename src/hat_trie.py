@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class HatTrieNode:
+    """Hybrid node: expanded children plus a burst container.
+
+    Words that diverge below this node sit as whole suffixes in the
+    bucket until it grows past the burst threshold; only then is the
+    next trie level materialized. __slots__ keeps these nodes small:
+    no per-instance __dict__, just the three fixed fields.
+    """
+
+    __slots__ = ("children", "bucket", "is_end")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "HatTrieNode"] = {}
+        self.bucket: Set[str] = set()
+        self.is_end = False
+
+
+class HatTrie:
+    """
+    HAT-trie-style Trie with the same interface as Trie.
+
+    Sparse, leaf-heavy regions are kept as flat buckets of suffix
+    strings instead of one node per character; a bucket "bursts" into
+    proper child nodes only once it exceeds burst_threshold entries.
+    This keeps the string-dense tail of the trie in a few contiguous
+    containers rather than a long chain of tiny nodes.
+    """
+
+    def __init__(self, burst_threshold: int = 16) -> None:
+        if burst_threshold < 1:
+            raise ValueError("burst_threshold must be at least 1")
+        self._root = HatTrieNode()
+        self._burst_threshold = burst_threshold
+        self._size = 0  # number of stored complete words
+
+    # ------------------------------------------------------
+    # Core public API
+    # ------------------------------------------------------
+
+    def insert(self, word: str) -> None:
+        """Insert a word into the Trie.
+        Time: O(m) amortized (bursts are rare and proportional to bucket size)
+        """
+        if not word:
+            return
+
+        node = self._root
+        i = 0
+        n = len(word)
+        while i < n:
+            child = node.children.get(word[i])
+            if child is None:
+                break
+            node = child
+            i += 1
+
+        if i == n:
+            if not node.is_end:
+                node.is_end = True
+                self._size += 1
+            return
+
+        suffix = word[i:]
+        if suffix in node.bucket:
+            return
+        node.bucket.add(suffix)
+        self._size += 1
+        if len(node.bucket) > self._burst_threshold:
+            self._burst(node)
+
+    def search(self, word: str) -> bool:
+        """Return True if the word exists as a complete word.
+        Time: O(m)
+        """
+        node = self._root
+        for i, ch in enumerate(word):
+            child = node.children.get(ch)
+            if child is None:
+                return word[i:] in node.bucket
+            node = child
+        return node.is_end
+
+    def starts_with(self, prefix: str) -> bool:
+        """Return True if any stored word begins with the prefix.
+        Time: O(p + bucket size at the frontier)
+        """
+        node, rest = self._locate(prefix)
+        if not rest:
+            return True
+        return any(s.startswith(rest) for s in node.bucket)
+
+    def get_words_with_prefix(
+        self, prefix: str, limit: Optional[int] = None
+    ) -> List[str]:
+        """Return words beginning with prefix. Stops at limit if provided.
+        Time: O(p + k·L')
+        """
+        node, rest = self._locate(prefix)
+        if rest:
+            # The prefix ends inside a bucket: filter its suffixes.
+            head = prefix[:len(prefix) - len(rest)]
+            matches = [
+                head + s for s in sorted(node.bucket) if s.startswith(rest)
+            ]
+            return matches if limit is None else matches[:limit]
+
+        results: List[str] = []
+        stack = [(node, prefix)]
+        while stack:
+            if limit is not None and len(results) >= limit:
+                break
+            n, acc = stack.pop()
+            if n.is_end:
+                results.append(acc)
+            # Buckets are sets, so sort before emitting: output is then
+            # deterministic instead of hash-order.
+            for s in sorted(n.bucket):
+                results.append(acc + s)
+            for ch in sorted(n.children, reverse=True):
+                stack.append((n.children[ch], acc + ch))
+        return results if limit is None else results[:limit]
+
+    def delete(self, word: str) -> bool:
+        """Delete a word. Returns True if deleted.
+        Time: O(m)
+        """
+        if not word:
+            return False
+
+        node = self._root
+        path: List[Tuple[HatTrieNode, str]] = []
+        for i, ch in enumerate(word):
+            child = node.children.get(ch)
+            if child is None:
+                # The word, if present, sits as a suffix in this node's
+                # bucket. Fall through to the shared pruning below: the
+                # removal may leave this node (and ancestors) empty.
+                if word[i:] not in node.bucket:
+                    return False
+                node.bucket.discard(word[i:])
+                self._size -= 1
+                break
+            path.append((node, ch))
+            node = child
+        else:
+            if not node.is_end:
+                return False
+            node.is_end = False
+            self._size -= 1
+
+        # Prune now-empty nodes back up the path, so starts_with never
+        # reports a path with no words below it.
+        while path:
+            parent, ch = path.pop()
+            n = parent.children[ch]
+            if n.is_end or n.children or n.bucket:
+                break
+            del parent.children[ch]
+        return True
+
+    def count_prefix(self, prefix: str) -> int:
+        """Count how many stored words start with the prefix.
+        Time: O(p + T)
+        """
+        node, rest = self._locate(prefix)
+        if rest:
+            return sum(1 for s in node.bucket if s.startswith(rest))
+
+        count = 0
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if n.is_end:
+                count += 1
+            count += len(n.bucket)
+            stack.extend(n.children.values())
+        return count
+
+    def size(self) -> int:
+        """Return number of stored words."""
+        return self._size
+
+    def is_empty(self) -> bool:
+        """Return True if Trie contains no words."""
+        return self._size == 0
+
+    # Pythonic convenience
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: str) -> bool:
+        return self.search(word)
+
+    # ------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------
+
+    def _locate(self, prefix: str) -> Tuple[HatTrieNode, str]:
+        """Descend as far as expanded children allow.
+        Returns (node, rest): rest is the part of the prefix that must be
+        matched against node's bucket ("" if fully consumed).
+        """
+        node = self._root
+        for i, ch in enumerate(prefix):
+            child = node.children.get(ch)
+            if child is None:
+                return node, prefix[i:]
+            node = child
+        return node, ""
+
+    def _burst(self, node: HatTrieNode) -> None:
+        """Distribute an oversized bucket one level down."""
+        for suffix in node.bucket:
+            child = node.children.get(suffix[0])
+            if child is None:
+                child = HatTrieNode()
+                node.children[suffix[0]] = child
+            if len(suffix) == 1:
+                child.is_end = True
+            else:
+                child.bucket.add(suffix[1:])
+        node.bucket = set()
+        # A child may have inherited more than the threshold itself.
+        for child in node.children.values():
+            if len(child.bucket) > self._burst_threshold:
+                self._burst(child)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Optional
+
+try:  # optional C-extension backend for the read-heavy demo
+    import marisa_trie
+except ImportError:
+    marisa_trie = None
+
+MARISA_AVAILABLE = marisa_trie is not None
+
+
+class MarisaTrie:
+    """
+    Read-only backend over the marisa-trie C extension, exposing the
+    query side of the Trie API (search, starts_with,
+    get_words_with_prefix, count_prefix, size).
+
+    MARISA stores the lexicon as a recursive LOUDS trie — roughly one
+    byte per character — and answers prefix queries entirely in C, so
+    it uses far less memory than the hand-rolled trie on real word
+    lists. The tradeoff: the structure is static. insert() and
+    delete() are unsupported; changing the word set means rebuilding,
+    which insert_batch() does in one shot.
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        if marisa_trie is None:
+            raise RuntimeError(
+                "the 'marisa-trie' package is not installed; "
+                "pip install marisa-trie or use the default backend"
+            )
+        self._trie = marisa_trie.Trie(words)
+        # Static backend: the blob cache in the app keys on _version,
+        # and nothing here ever mutates.
+        self._version = 0
+
+    def search(self, word: str) -> bool:
+        """Return True if the word exists as a complete word.
+        Time: O(m)
+        """
+        return word in self._trie
+
+    def starts_with(self, prefix: str) -> bool:
+        """Return True if any stored word begins with the prefix.
+        Time: O(p)
+        """
+        return self._trie.has_keys_with_prefix(prefix)
+
+    def get_words_with_prefix(
+        self, prefix: str, limit: Optional[int] = None
+    ) -> List[str]:
+        """Return words beginning with prefix, lexicographically.
+        Stops at limit if provided.
+        Time: O(p + k·L')
+        """
+        words = sorted(self._trie.keys(prefix))
+        return words if limit is None else words[:limit]
+
+    def count_prefix(self, prefix: str) -> int:
+        """Count how many stored words start with the prefix.
+        Time: O(p + k)
+        """
+        return len(self._trie.keys(prefix))
+
+    def insert_batch(self, words: Iterable[str]) -> None:
+        """Rebuild the trie with words added. MARISA tries are static,
+        so this is a full reconstruction — batch your additions.
+        Time: O(total chars)
+        """
+        merged = list(self._trie.keys())
+        merged.extend(words)
+        self._trie = marisa_trie.Trie(merged)
+
+    # Single-word mutation is not part of this backend's contract.
+    def insert(self, word: str) -> None:
+        raise NotImplementedError(
+            "marisa backend is read-only; use insert_batch to rebuild"
+        )
+
+    def insert_returning_new(self, word: str) -> bool:
+        raise NotImplementedError(
+            "marisa backend is read-only; use insert_batch to rebuild"
+        )
+
+    def delete(self, word: str) -> bool:
+        raise NotImplementedError(
+            "marisa backend is read-only; rebuild without the word instead"
+        )
+
+    def finalize_sort(self) -> None:
+        """No-op: results are already emitted in sorted order."""
+
+    def size(self) -> int:
+        """Return number of stored words."""
+        return len(self._trie)
+
+    def is_empty(self) -> bool:
+        """Return True if the backend contains no words."""
+        return len(self._trie) == 0
+
+    # Pythonic convenience
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def __contains__(self, word: str) -> bool:
+        return self.search(word)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import mmap
 import os
+import re
+import string
 import sys
 import time
 import textwrap
@@ -11,6 +14,18 @@ from trie import Trie
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 DEFAULT_WORDS_FILE = os.path.join(DATA_DIR, "words.txt")
 
+# A precompiled A-Z -> a-z translation table. Lowercasing user input via
+# translate() with this table skips the generic str.lower() machinery.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Byte-level counterpart for the word-file loader: a 256-byte lookup
+# table that maps A-Z to a-z and leaves every other byte alone, so the
+# whole mmapped file is normalized by a single translate() call.
+_LOWER = bytes.maketrans(
+    bytes(range(ord("A"), ord("Z") + 1)),
+    bytes(range(ord("a"), ord("z") + 1)),
+)
+
 
 def load_words(trie: Trie, path: str) -> int:
     """
@@ -47,14 +62,16 @@ def load_words(trie: Trie, path: str) -> int:
             trie.insert(w.lower())
         return len(seed_words)
 
-    inserted = 0
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            word = line.strip().lower()
-            if word:
-                trie.insert(word)
-                inserted += 1
-    return inserted
+    if os.path.getsize(path) == 0:
+        return 0
+
+    # Map the file into memory, lowercase the whole buffer with one
+    # table-driven translate() and split it into words, instead of
+    # reading and normalizing line by line.
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            data = buf[:].translate(_LOWER)
+    return trie.insert_many(data.split(b"\n"))
 
 
 def collect_all_words(trie: Trie) -> list[str]:
@@ -65,19 +82,37 @@ def collect_all_words(trie: Trie) -> list[str]:
     """
     results: list[str] = []
 
-    # access internal root just for comparison and demo purposes
-    root = trie._root  # type: ignore[attr-defined]
+    # access internal arrays just for comparison and demo purposes
+    children = trie._children  # type: ignore[attr-defined]
+    is_end = trie._is_end  # type: ignore[attr-defined]
+
+    # Same explicit-stack DFS as Trie.get_words_with_prefix, rooted at
+    # the empty prefix, writing into a preallocated path buffer.
+    buf = bytearray(max(trie._max_len, 1))  # type: ignore[attr-defined]
+    stack: list[tuple] = [(0, 0, None)]
+    while stack:
+        node, depth, c = stack.pop()
+        if c is not None:
+            buf[depth - 1] = c
+        if is_end[node]:
+            results.append(buf[:depth].decode("utf-8"))
+        for c2, child in reversed(children[node].items()):
+            stack.append((child, depth + 1, c2))
+    return results
 
-    def dfs(node, path: list[str]) -> None:
-        if node.is_end:
-            results.append("".join(path))
-        for ch, child in node.children.items():
-            path.append(ch)
-            dfs(child, path)
-            path.pop()
 
-    dfs(root, [])
-    return results
+# The compare command's baseline scans one newline-joined blob of every
+# stored word. The blob is memoized here and rebuilt only when the
+# trie's mutation counter moves.
+_words_blob_cache: tuple | None = None
+
+
+def _words_blob(trie: Trie) -> str:
+    global _words_blob_cache
+    key = (id(trie), trie._version)  # type: ignore[attr-defined]
+    if _words_blob_cache is None or _words_blob_cache[0] != key:
+        _words_blob_cache = (key, "\n".join(collect_all_words(trie)))
+    return _words_blob_cache[1]
 
 
 def print_help() -> None:
@@ -97,6 +132,116 @@ def print_help() -> None:
     print(help_text)
 
 
+def _parse_limit(args: list[str]) -> int:
+    """Parse the optional [limit] argument, defaulting to 10."""
+    limit = 10
+    if len(args) > 1:
+        try:
+            limit = int(args[1])
+        except ValueError:
+            print("Limit must be an integer; using default = 10.")
+    return limit
+
+
+def _cmd_help(trie: Trie, args: list[str]) -> None:
+    print_help()
+
+
+def _cmd_stats(trie: Trie, args: list[str]) -> None:
+    print(f"Words stored in trie: {trie.size()}")
+
+
+def _cmd_search(trie: Trie, args: list[str]) -> None:
+    if not args:
+        print("Usage: search <word>")
+        return
+    word = args[0].translate(_ASCII_LOWER)
+    print("YES" if trie.search(word) else "NO")
+
+
+def _cmd_prefix(trie: Trie, args: list[str]) -> None:
+    if not args:
+        print("Usage: prefix <prefix> [limit]")
+        return
+    prefix = args[0].translate(_ASCII_LOWER)
+    limit = _parse_limit(args)
+    words = trie.get_words_with_prefix(prefix, limit=limit)
+    if not words:
+        print("(no matches)")
+    else:
+        for w in words:
+            print(" ", w)
+
+
+def _cmd_add(trie: Trie, args: list[str]) -> None:
+    if not args:
+        print("Usage: add <word>")
+        return
+    word = args[0].translate(_ASCII_LOWER)
+    # A single fused traversal replaces the old search-then-insert pair.
+    if trie.insert_returning_new(word):
+        print(f"Added '{word}'.")
+    else:
+        print(f"'{word}' was already present.")
+
+
+def _cmd_delete(trie: Trie, args: list[str]) -> None:
+    if not args:
+        print("Usage: delete <word>")
+        return
+    word = args[0].translate(_ASCII_LOWER)
+    if trie.delete(word):
+        print(f"Deleted '{word}'.")
+    else:
+        print(f"'{word}' not found.")
+
+
+def _cmd_compare(trie: Trie, args: list[str]) -> None:
+    if not args:
+        print("Usage: compare <prefix> [limit]")
+        return
+    prefix = args[0].translate(_ASCII_LOWER)
+    limit = _parse_limit(args)
+
+    # Linear search: still a scan over every word, but executed by the
+    # regex engine in C over the memoized blob instead of a Python-level
+    # startswith loop per word.
+    blob = _words_blob(trie)
+    pattern = re.compile(r"^" + re.escape(prefix) + r"[^\n]*", re.MULTILINE)
+
+    start = time.perf_counter()
+    linear_matches = pattern.findall(blob)
+    linear_time = time.perf_counter() - start
+
+    # Trie search
+    start = time.perf_counter()
+    trie_matches = trie.get_words_with_prefix(prefix, limit=None)
+    trie_time = time.perf_counter() - start
+
+    print(
+        f"Linear search found {len(linear_matches)} matches in {linear_time * 1e6:.1f} µs"
+    )
+    print(
+        f"Trie search found   {len(trie_matches)} matches in {trie_time * 1e6:.1f} µs"
+    )
+    print(f"First {limit} trie matches:")
+    for w in trie_matches[:limit]:
+        print(" ", w)
+
+
+# Command name -> handler. Dict dispatch is O(1) per command and keeps
+# each command's logic in its own small function.
+HANDLERS = {
+    "help": _cmd_help,
+    "stats": _cmd_stats,
+    "search": _cmd_search,
+    "prefix": _cmd_prefix,
+    "add": _cmd_add,
+    "delete": _cmd_delete,
+    "compare": _cmd_compare,
+}
+
+
 def main() -> None:
     trie = Trie()
 
@@ -106,6 +251,9 @@ def main() -> None:
         words_file = sys.argv[1]
 
     loaded = load_words(trie, words_file)
+    # One-time pass that orders every children row, so prefix queries
+    # come back in lexicographic order without per-query sorting.
+    trie.finalize_sort()
     file_label = os.path.basename(words_file) if os.path.exists(words_file) else "built-in word list"
     print(f"Loaded {loaded} words (source: {file_label})")
     print("Trie Autocomplete Demo")
@@ -125,103 +273,18 @@ def main() -> None:
             continue
 
         parts = raw.split()
-        cmd = parts[0].lower()
+        cmd = parts[0].translate(_ASCII_LOWER)
         args = parts[1:]
 
         if cmd in ("quit", "exit", "q"):
             print("Bye.")
             break
 
-        if cmd == "help":
-            print_help()
-
-        elif cmd == "stats":
-            print(f"Words stored in trie: {trie.size()}")
-
-        elif cmd == "search":
-            if not args:
-                print("Usage: search <word>")
-                continue
-            word = args[0].lower()
-            print("YES" if trie.search(word) else "NO")
-
-        elif cmd == "prefix":
-            if not args:
-                print("Usage: prefix <prefix> [limit]")
-                continue
-            prefix = args[0].lower()
-            limit = 10
-            if len(args) > 1:
-                try:
-                    limit = int(args[1])
-                except ValueError:
-                    print("Limit must be an integer; using default = 10.")
-            words = trie.get_words_with_prefix(prefix, limit=limit)
-            if not words:
-                print("(no matches)")
-            else:
-                for w in words:
-                    print(" ", w)
-
-        elif cmd == "add":
-            if not args:
-                print("Usage: add <word>")
-                continue
-            word = args[0].lower()
-            existed = trie.search(word)
-            trie.insert(word)
-            if existed:
-                print(f"'{word}' was already present.")
-            else:
-                print(f"Added '{word}'.")
-
-        elif cmd == "delete":
-            if not args:
-                print("Usage: delete <word>")
-                continue
-            word = args[0].lower()
-            if trie.delete(word):
-                print(f"Deleted '{word}'.")
-            else:
-                print(f"'{word}' not found.")
-
-        elif cmd == "compare":
-            if not args:
-                print("Usage: compare <prefix> [limit]")
-                continue
-            prefix = args[0].lower()
-            limit = 10
-            if len(args) > 1:
-                try:
-                    limit = int(args[1])
-                except ValueError:
-                    print("Limit must be an integer; using default = 10.")
-
-            all_words = collect_all_words(trie)
-
-            # Linear search
-            start = time.perf_counter()
-            linear_matches = [w for w in all_words if w.startswith(prefix)]
-            linear_time = time.perf_counter() - start
-
-            # Trie search
-            start = time.perf_counter()
-            trie_matches = trie.get_words_with_prefix(prefix, limit=None)
-            trie_time = time.perf_counter() - start
-
-            print(
-                f"Linear search found {len(linear_matches)} matches in {linear_time * 1e6:.1f} µs"
-            )
-            print(
-                f"Trie search found   {len(trie_matches)} matches in {trie_time * 1e6:.1f} µs"
-            )
-            print(f"First {limit} trie matches:")
-            for w in trie_matches[:limit]:
-                print(" ", w)
-
-        else:
+        handler = HANDLERS.get(cmd)
+        if handler is None:
             print("Unknown or malformed command. Type 'help'.")
-            continue
+        else:
+            handler(trie, args)
 
 
 if __name__ == "__main__":
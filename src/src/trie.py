@@ -1,14 +1,34 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-
-
-@dataclass
-class TrieNode:
-    """A single node in the Trie."""
-    children: Dict[str, "TrieNode"] = field(default_factory=dict)
-    is_end: bool = False
+import sys
+from array import array
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# numba is an optional accelerator: when it is installed, FrozenTrie
+# runs its per-character walk as jitted machine code over numpy views of
+# the base/check arrays. Without it the pure-Python loop is used.
+try:
+    import numba
+    import numpy
+except ImportError:
+    numba = None
+    numpy = None
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _walk_dat(base, check, word):  # pragma: no cover - needs numba
+        """Jitted double-array transition walk; returns the final state
+        reached for word, or -1 if the path does not exist."""
+        s = 0
+        n = check.shape[0]
+        for i in range(word.shape[0]):
+            t = base[s] + word[i] + 1
+            if t >= n or check[t] != s:
+                return -1
+            s = t
+        return s
 
 
 class Trie:
@@ -23,11 +43,42 @@ class Trie:
     - delete(word)
     - count_prefix(prefix)
     - size(), is_empty()
+
+    Internally the Trie is stored structure-of-arrays style: rather than
+    allocating one Python object per node, parallel arrays indexed by an
+    integer node id hold each node's children mapping (character code ->
+    child id) and its end-of-word flag. This keeps the per-node metadata
+    compact and contiguous in memory.
+
+    Words are encoded to UTF-8 bytes once when they enter the Trie, so
+    the traversal loops work with plain integers rather than allocating
+    a 1-character string per step.
     """
 
+    # Maximum number of cached query results before LRU eviction.
+    _CACHE_MAX = 128
+
     def __init__(self) -> None:
-        self._root = TrieNode()
+        # Node id 0 is the root. For a node with id i:
+        #   _children[i] maps ord(ch) -> child node id
+        #   _is_end[i]   is 1 if a complete word ends at node i
+        self._children: List[Dict[int, int]] = [{}]
+        self._is_end = bytearray([0])
+        # _subtree[i] holds the number of stored words in the subtree
+        # rooted at node i. insert/delete keep it current, which lets
+        # count_prefix answer with a single array read.
+        self._subtree = array("i", [0])
+        # Node ids released by delete(), available for reuse by insert().
+        self._free: List[int] = []
         self._size = 0  # number of distinct words
+        # Upper bound on the encoded length of any word ever inserted;
+        # sizes the preallocated DFS path buffer.
+        self._max_len = 0
+        # Counts mutations. Cached query results include the version in
+        # their key, so inserting or deleting a word implicitly
+        # invalidates every stale cache entry.
+        self._version = 0
+        self._prefix_cache: "OrderedDict[tuple, Tuple[str, ...]]" = OrderedDict()
 
     # ------------------------
     # Public API
@@ -40,18 +91,104 @@ class Trie:
         Time: O(m), where m is the length of the word.
         Space: O(m) in the worst case.
         """
-        if not word:
-            return
+        self.insert_returning_new(word)
+
+    def insert_returning_new(self, word: str) -> bool:
+        """
+        Insert a word and return True if it was not already stored.
+
+        The newness information falls out of the normal insert walk, so
+        callers that need it (like the application's add command) avoid
+        a separate search() traversal beforehand.
 
-        node = self._root
-        for ch in word:
-            if ch not in node.children:
-                node.children[ch] = TrieNode()
-            node = node.children[ch]
+        Time: O(m), where m is the length of the word.
+        Space: O(m) in the worst case.
+        """
+        if not word:
+            return False
 
-        if not node.is_end:
-            node.is_end = True
+        data = word.encode("utf-8")
+        if len(data) > self._max_len:
+            self._max_len = len(data)
+
+        children = self._children
+        node = 0
+        path_nodes = [0]
+        for c in data:
+            nxt = children[node].get(c)
+            if nxt is None:
+                nxt = self._new_node()
+                children[node][c] = nxt
+            node = nxt
+            path_nodes.append(node)
+
+        if not self._is_end[node]:
+            self._is_end[node] = 1
             self._size += 1
+            self._version += 1
+            # A new word contributes one to every node along its path.
+            for n in path_nodes:
+                self._subtree[n] += 1
+            return True
+        return False
+
+    def insert_many(self, words: Iterable[bytes]) -> int:
+        """
+        Bulk-insert words that are already encoded as bytes.
+
+        Empty entries are skipped and surrounding whitespace is stripped,
+        so the output of bytes.split() can be passed in directly. Returns
+        the number of words processed (duplicates included).
+
+        Time: O(total bytes across all words)
+        """
+        children = self._children
+        is_end = self._is_end
+        subtree = self._subtree
+        processed = 0
+        for data in words:
+            data = data.strip()
+            if not data:
+                continue
+            if len(data) > self._max_len:
+                self._max_len = len(data)
+            node = 0
+            path_nodes = [0]
+            for c in data:
+                nxt = children[node].get(c)
+                if nxt is None:
+                    nxt = self._new_node()
+                    children[node][c] = nxt
+                node = nxt
+                path_nodes.append(node)
+            if not is_end[node]:
+                is_end[node] = 1
+                self._size += 1
+                self._version += 1
+                for n in path_nodes:
+                    subtree[n] += 1
+            processed += 1
+        return processed
+
+    def finalize_sort(self) -> None:
+        """
+        Rewrite every children row so its keys are in ascending byte
+        order. Dict iteration follows insertion order, so after this
+        pass the DFS in get_words_with_prefix naturally emits words in
+        lexicographic order without any per-query sorting.
+
+        Intended to be called once after bulk loading; words inserted
+        afterwards simply append to the end of their row again.
+
+        Time: O(total nodes * fanout log fanout)
+        Space: O(max fanout)
+        """
+        children = self._children
+        for i in range(len(children)):
+            row = children[i]
+            if len(row) > 1:
+                children[i] = dict(sorted(row.items()))
+        self._version += 1
 
     def search(self, word: str) -> bool:
         """
@@ -61,7 +198,7 @@ class Trie:
         Space: O(1)
         """
         node = self._traverse(word)
-        return bool(node and node.is_end)
+        return node is not None and self._is_end[node] == 1
 
     def starts_with(self, prefix: str) -> bool:
         """
@@ -82,26 +219,58 @@ class Trie:
           p = length of prefix
           k = number of results
           L = average length of the words returned
+        On a cache hit the DFS is skipped entirely: O(k).
         Space: O(k * L) for results.
         """
+        key = (prefix, limit, self._version)
+        cached = self._prefix_cache.get(key)
+        if cached is not None:
+            self._prefix_cache.move_to_end(key)
+            return list(cached)
+
         node = self._traverse(prefix)
         if node is None:
             return []
 
         results: List[str] = []
-        path = list(prefix)
-
-        def dfs(n: TrieNode) -> None:
-            if limit is not None and len(results) >= limit:
-                return
-            if n.is_end:
-                results.append("".join(path))
-            for ch, child in n.children.items():
-                path.append(ch)
-                dfs(child)
-                path.pop()
-
-        dfs(node)
+        encoded = prefix.encode("utf-8")
+        # The path buffer is preallocated to the longest stored word, so
+        # descending writes a single byte at the right depth instead of
+        # growing and shrinking the buffer at every step.
+        buf = bytearray(max(self._max_len, len(encoded), 1))
+        buf[:len(encoded)] = encoded
+
+        # Hoist the arrays to locals so the loop body does plain
+        # subscripting instead of repeated attribute lookups.
+        children = self._children
+        is_end = self._is_end
+
+        # Iterative DFS with an explicit stack instead of recursion, so
+        # deep tries cannot hit the recursion limit. Each entry records
+        # (node, path length at that node, incoming byte); children are
+        # pushed in reverse so pop order matches the recursive version.
+        stack: List[tuple] = [(node, len(encoded), None)]
+        while stack:
+            n, depth, c = stack.pop()
+            if c is not None:
+                buf[depth - 1] = c
+            if is_end[n]:
+                # The limit is checked before appending — not after — so
+                # that limit=0 returns an empty list, exactly like the
+                # recursive implementation did.
+                if limit is not None and len(results) >= limit:
+                    break
+                # sys.intern gives every emission of the same word one
+                # canonical object, shared by the cache and all callers.
+                results.append(sys.intern(buf[:depth].decode("utf-8")))
+            for c2, child in reversed(children[n].items()):
+                stack.append((child, depth + 1, c2))
+
+        # Store an immutable copy, so callers are free to mutate the
+        # list they get back without corrupting the cache.
+        self._prefix_cache[key] = tuple(results)
+        if len(self._prefix_cache) > self._CACHE_MAX:
+            self._prefix_cache.popitem(last=False)
         return results
 
     def delete(self, word: str) -> bool:
@@ -113,57 +282,113 @@ class Trie:
         Space: O(m) recursion stack
         """
 
-        def _delete(node: TrieNode, depth: int) -> bool:
-            if depth == len(word):
-                if not node.is_end:
+        data = word.encode("utf-8")
+        found = False
+
+        def _delete(node: int, depth: int) -> bool:
+            nonlocal found
+            if depth == len(data):
+                if not self._is_end[node]:
                     return False  # word not found
-                node.is_end = False
+                found = True
+                self._is_end[node] = 0
                 self._size -= 1
+                self._subtree[node] -= 1
                 # prune if no children
-                return len(node.children) == 0
+                return len(self._children[node]) == 0
 
-            ch = word[depth]
-            child = node.children.get(ch)
+            c = data[depth]
+            child = self._children[node].get(c)
             if child is None:
                 return False  # word not found
 
             should_prune_child = _delete(child, depth + 1)
+            # The unwind passes through every ancestor of the deleted
+            # word, which is exactly where the counters need updating.
+            if found:
+                self._subtree[node] -= 1
             if should_prune_child:
-                del node.children[ch]
+                del self._children[node][c]
+                self._free.append(child)
                 # prune this node if it isn't terminal and has no children
-                return not node.is_end and len(node.children) == 0
+                return not self._is_end[node] and len(self._children[node]) == 0
 
             return False
 
         if not word:
             return False
 
-        existed = self.search(word)
-        _ = _delete(self._root, 0)
-        return existed
+        # The recursive walk sets `found` when it clears a terminal, so
+        # the old search() pre-scan (a second full traversal) is gone.
+        _ = _delete(0, 0)
+        if found:
+            self._version += 1
+        return found
 
     def count_prefix(self, prefix: str) -> int:
         """
         Count how many words in the Trie start with the given prefix.
 
-        Time: O(p + T), where T is the size of the subtree.
-        Space: O(h) recursion stack.
+        The answer comes straight from the per-node subtree counters, so
+        no subtree is walked.
+
+        Time: O(p)
+        Space: O(1)
         """
         node = self._traverse(prefix)
         if node is None:
             return 0
+        return self._subtree[node]
 
-        count = 0
+    def freeze(self) -> "FrozenTrie":
+        """
+        Build a read-only FrozenTrie snapshot of the current contents.
 
-        def dfs(n: TrieNode) -> None:
-            nonlocal count
-            if n.is_end:
-                count += 1
-            for child in n.children.values():
-                dfs(child)
+        The snapshot stores the trie as a double-array (base/check)
+        structure, which answers queries with one integer addition per
+        character. Useful once loading is finished and only lookups
+        remain.
 
-        dfs(node)
-        return count
+        Time: O(total nodes), amortized over the base search.
+        """
+        base = array("i", [0])
+        check = array("i", [-1])
+        is_end = bytearray([self._is_end[0]])
+
+        def ensure(n: int) -> None:
+            while len(check) <= n:
+                base.append(0)
+                check.append(-1)
+                is_end.append(0)
+
+        # Breadth-first placement (Aoe's construction): for every node we
+        # choose a base b such that the slot b + c + 1 is free for each
+        # child byte c, then claim those slots.
+        queue = deque([(0, 0)])  # (trie node id, DAT state)
+        hint = 1  # lowest slot that might still be free
+        while queue:
+            node, s = queue.popleft()
+            items = sorted(self._children[node].items())
+            if not items:
+                continue
+            b = hint
+            while True:
+                if all(
+                    b + c + 1 >= len(check) or check[b + c + 1] == -1
+                    for c, _ in items
+                ):
+                    break
+                b += 1
+            base[s] = b
+            for c, child in items:
+                t = b + c + 1
+                ensure(t)
+                check[t] = s
+                is_end[t] = self._is_end[child]
+                queue.append((child, t))
+            while hint < len(check) and check[hint] != -1:
+                hint += 1
+        return FrozenTrie(base, check, is_end, self._size, self._max_len)
 
     def size(self) -> int:
         """
@@ -192,17 +417,216 @@ class Trie:
     # Internal helpers
     # ------------------------
 
-    def _traverse(self, string: str) -> Optional[TrieNode]:
+    def _new_node(self) -> int:
+        """
+        Allocate a new node id, reusing a previously pruned id when one
+        is available.
+        """
+        if self._free:
+            nid = self._free.pop()
+            self._children[nid] = {}
+            self._is_end[nid] = 0
+            self._subtree[nid] = 0
+            return nid
+        self._children.append({})
+        self._is_end.append(0)
+        self._subtree.append(0)
+        return len(self._children) - 1
+
+    def _traverse(self, string: str) -> Optional[int]:
         """
         Traverse the Trie according to the given string and
-        return the node at the end of the path, or None if it doesn't exist.
+        return the node id at the end of the path, or None if it doesn't exist.
         """
         if string == "":
-            return self._root
+            return 0
 
-        node = self._root
-        for ch in string:
-            node = node.children.get(ch)
-            if node is None:
+        # The children table is rebound to a local so each iteration
+        # costs one subscript rather than an attribute lookup as well.
+        children = self._children
+        node = 0
+        for c in string.encode("utf-8"):
+            nxt = children[node].get(c)
+            if nxt is None:
                 return None
+            node = nxt
         return node
+
+
+class FrozenTrie:
+    """
+    Read-only snapshot of a Trie stored as a double-array trie.
+
+    A transition on byte c out of state s resolves as t = base[s] + c + 1
+    and is valid when check[t] == s, so each character costs one integer
+    addition and one bounds check — no hashing and no per-node objects.
+
+    The snapshot supports the read half of the Trie API: search,
+    starts_with, get_words_with_prefix, count_prefix, size and is_empty.
+    It cannot be mutated; build a new one with Trie.freeze() instead.
+    """
+
+    def __init__(
+        self,
+        base: array,
+        check: array,
+        is_end: bytearray,
+        size: int,
+        max_len: int = 0,
+    ) -> None:
+        self._base = base
+        self._check = check
+        self._is_end = is_end
+        self._size = size
+        # Upper bound on the encoded length of any stored word; sizes
+        # the preallocated DFS path buffer.
+        self._max_len = max_len
+        if numba is not None:
+            # Zero-copy ndarray views over the same buffers, in the form
+            # the jitted walk expects.
+            self._base_np = numpy.frombuffer(base, dtype=numpy.intc)
+            self._check_np = numpy.frombuffer(check, dtype=numpy.intc)
+
+    def search(self, word: str) -> bool:
+        """
+        Check if a word exists in the snapshot as a complete word.
+
+        Time: O(m)
+        Space: O(1)
+        """
+        s = self._walk(word)
+        return s is not None and self._is_end[s] == 1
+
+    def starts_with(self, prefix: str) -> bool:
+        """
+        Check if any word in the snapshot starts with the given prefix.
+
+        Time: O(p)
+        Space: O(1)
+        """
+        return self._walk(prefix) is not None
+
+    def get_words_with_prefix(
+        self, prefix: str, limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Return a list of words that start with the given prefix.
+
+        Time: O(p + k * L), plus a constant 256-slot probe per visited
+        state to discover its children.
+        Space: O(k * L) for results.
+        """
+        start = self._walk(prefix)
+        if start is None:
+            return []
+
+        base = self._base
+        check = self._check
+        is_end = self._is_end
+        n_states = len(check)
+
+        results: List[str] = []
+        encoded = prefix.encode("utf-8")
+        buf = bytearray(max(self._max_len, len(encoded), 1))
+        buf[:len(encoded)] = encoded
+        stack: List[tuple] = [(start, len(encoded), None)]
+        while stack:
+            s, depth, c = stack.pop()
+            if c is not None:
+                buf[depth - 1] = c
+            if is_end[s]:
+                # Same ordering as Trie.get_words_with_prefix: the
+                # limit is tested before appending, so limit=0 returns
+                # an empty list here too.
+                if limit is not None and len(results) >= limit:
+                    break
+                results.append(sys.intern(buf[:depth].decode("utf-8")))
+            # A slot t belongs to s exactly when check[t] == s, so the
+            # children of s are found by probing every byte value.
+            b = base[s]
+            for c2 in range(255, -1, -1):
+                t = b + c2 + 1
+                if t < n_states and check[t] == s:
+                    stack.append((t, depth + 1, c2))
+        return results
+
+    def count_prefix(self, prefix: str) -> int:
+        """
+        Count how many words in the snapshot start with the given prefix.
+
+        Time: O(p + T), where T is the size of the subtree.
+        Space: O(T) for the explicit stack in the worst case.
+        """
+        start = self._walk(prefix)
+        if start is None:
+            return 0
+
+        base = self._base
+        check = self._check
+        is_end = self._is_end
+        n_states = len(check)
+
+        count = 0
+        stack = [start]
+        while stack:
+            s = stack.pop()
+            if is_end[s]:
+                count += 1
+            b = base[s]
+            for c in range(256):
+                t = b + c + 1
+                if t < n_states and check[t] == s:
+                    stack.append(t)
+        return count
+
+    def size(self) -> int:
+        """
+        Return the number of distinct words in the snapshot.
+
+        Time: O(1)
+        """
+        return self._size
+
+    def is_empty(self) -> bool:
+        """
+        Return True if the snapshot contains no words.
+
+        Time: O(1)
+        """
+        return self._size == 0
+
+    # Pythonic helpers
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: str) -> bool:  # allows: `word in frozen`
+        return self.search(word)
+
+    # ------------------------
+    # Internal helpers
+    # ------------------------
+
+    def _walk(self, string: str) -> Optional[int]:
+        """
+        Follow the double-array transitions for the given string and
+        return the final state, or None if the path does not exist.
+        """
+        data = string.encode("utf-8")
+        if numba is not None:
+            s = _walk_dat(
+                self._base_np,
+                self._check_np,
+                numpy.frombuffer(data, dtype=numpy.uint8),
+            )
+            return None if s < 0 else s
+
+        base = self._base
+        check = self._check
+        n_states = len(check)
+        s = 0
+        for c in data:
+            t = base[s] + c + 1
+            if t >= n_states or check[t] != s:
+                return None
+            s = t
+        return s
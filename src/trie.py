@@ -1,14 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-
-
-@dataclass
-class TrieNode:
-    """A single node in the Trie."""
-    children: Dict[str, "TrieNode"] = field(default_factory=dict)
-    is_end: bool = False
+import sys
+from array import array
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:  # optional accelerator for FrozenTrie traversal
+    import numba
+    import numpy
+except ImportError:
+    numba = None
+    numpy = None
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _walk_dat(base, check, word):  # pragma: no cover - needs numba
+        """Jitted double-array walk. Returns final state or -1."""
+        s = 0
+        n = check.shape[0]
+        for i in range(word.shape[0]):
+            t = base[s] + word[i] + 1
+            if t >= n or check[t] != s:
+                return -1
+            s = t
+        return s
 
 
 class Trie:
@@ -21,11 +37,36 @@ class Trie:
       - delete(word)
       - count_prefix(prefix)
       - size(), is_empty()
+
+    Nodes are stored structure-of-arrays style: instead of one object per
+    node, parallel arrays indexed by an integer node id hold the children
+    mapping (char code -> child id) and the end-of-word flag. This keeps
+    node metadata contiguous in memory and avoids a Python object
+    allocation per character.
+
+    Strings are encoded to UTF-8 bytes once at the API boundary, so the
+    hot loops iterate over plain ints instead of 1-char strings.
     """
 
+    # Bound on cached query results (LRU eviction past this).
+    _CACHE_MAX = 128
+
     def __init__(self) -> None:
-        self._root = TrieNode()
+        # Node id 0 is the root. For node i:
+        #   _children[i] maps ord(ch) -> child node id
+        #   _is_end[i]   is 1 if a word ends at node i
+        self._children: List[Dict[int, int]] = [{}]
+        self._is_end = bytearray([0])
+        # _subtree[i] = number of stored words in the subtree rooted at i,
+        # kept current by insert/delete so count_prefix is one array read.
+        self._subtree = array("i", [0])
+        self._free: List[int] = []  # node ids released by delete(), reused by insert()
         self._size = 0  # number of stored complete words
+        self._max_len = 0  # upper bound on encoded word length ever inserted
+        # Mutation counter; query caches key on it so any insert/delete
+        # implicitly invalidates stale entries.
+        self._version = 0
+        self._prefix_cache: "OrderedDict[tuple, Tuple[str, ...]]" = OrderedDict()
 
     # ------------------------------------------------------
     # Core public API
@@ -35,25 +76,92 @@ class Trie:
         """Insert a word into the Trie.
         Time: O(m)
         """
-        if not word:
-            return
+        self.insert_returning_new(word)
 
-        node = self._root
-        for ch in word:
-            if ch not in node.children:
-                node.children[ch] = TrieNode()
-            node = node.children[ch]
+    def insert_returning_new(self, word: str) -> bool:
+        """Insert a word and report whether it was newly added, in one
+        traversal (no separate search needed before insert).
+        Time: O(m)
+        """
+        if not word:
+            return False
 
-        if not node.is_end:
-            node.is_end = True
+        data = word.encode("utf-8")
+        if len(data) > self._max_len:
+            self._max_len = len(data)
+
+        children = self._children
+        node = 0
+        path_nodes = [0]
+        for c in data:
+            nxt = children[node].get(c)
+            if nxt is None:
+                nxt = self._new_node()
+                children[node][c] = nxt
+            node = nxt
+            path_nodes.append(node)
+
+        if not self._is_end[node]:
+            self._is_end[node] = 1
             self._size += 1
+            self._version += 1
+            for n in path_nodes:
+                self._subtree[n] += 1
+            return True
+        return False
+
+    def insert_many(self, words: Iterable[bytes]) -> int:
+        """Bulk-insert pre-encoded words. Empty entries are skipped and
+        surrounding whitespace is stripped. Returns words processed.
+        Time: O(total bytes)
+        """
+        children = self._children
+        is_end = self._is_end
+        subtree = self._subtree
+        processed = 0
+        for data in words:
+            data = data.strip()
+            if not data:
+                continue
+            if len(data) > self._max_len:
+                self._max_len = len(data)
+            node = 0
+            path_nodes = [0]
+            for c in data:
+                nxt = children[node].get(c)
+                if nxt is None:
+                    nxt = self._new_node()
+                    children[node][c] = nxt
+                node = nxt
+                path_nodes.append(node)
+            if not is_end[node]:
+                is_end[node] = 1
+                self._size += 1
+                self._version += 1
+                for n in path_nodes:
+                    subtree[n] += 1
+            processed += 1
+        return processed
+
+    def finalize_sort(self) -> None:
+        """Rewrite every children row in byte order so DFS emits words
+        lexicographically with no per-query sorting. Call after bulk
+        loading; later inserts append at the end of their row again.
+        Time: O(total nodes · fanout log fanout)
+        """
+        children = self._children
+        for i in range(len(children)):
+            row = children[i]
+            if len(row) > 1:
+                children[i] = dict(sorted(row.items()))
+        self._version += 1
 
     def search(self, word: str) -> bool:
         """Return True if the word exists as a complete word.
         Time: O(m)
         """
         node = self._traverse(word)
-        return bool(node and node.is_end)
+        return node is not None and self._is_end[node] == 1
 
     def starts_with(self, prefix: str) -> bool:
         """Return True if any stored word begins with the prefix.
@@ -65,26 +173,51 @@ class Trie:
         self, prefix: str, limit: Optional[int] = None
     ) -> List[str]:
         """Return words beginning with prefix. Stops at limit if provided.
-        Time: O(p + k·L')
+        Repeated queries are served from a version-keyed LRU cache.
+        Time: O(p + k·L'), O(k) on a cache hit
         """
+        key = (prefix, limit, self._version)
+        cached = self._prefix_cache.get(key)
+        if cached is not None:
+            self._prefix_cache.move_to_end(key)
+            return list(cached)
+
         node = self._traverse(prefix)
         if node is None:
             return []
 
         results: List[str] = []
-        path = list(prefix)
-
-        def dfs(n: TrieNode) -> None:
-            if limit is not None and len(results) >= limit:
-                return
-            if n.is_end:
-                results.append("".join(path))
-            for ch, child in n.children.items():
-                path.append(ch)
-                dfs(child)
-                path.pop()
-
-        dfs(node)
+        encoded = prefix.encode("utf-8")
+        # Preallocated path buffer: every word fits, so descent just
+        # writes one byte at its depth — no resizing or list churn.
+        buf = bytearray(max(self._max_len, len(encoded), 1))
+        buf[:len(encoded)] = encoded
+        children = self._children
+        is_end = self._is_end
+
+        # Iterative DFS: each entry is (node, path length at node, incoming
+        # byte). Children are pushed in reverse so pop order matches the
+        # recursive traversal.
+        stack: List[tuple] = [(node, len(encoded), None)]
+        while stack:
+            n, depth, c = stack.pop()
+            if c is not None:
+                buf[depth - 1] = c
+            if is_end[n]:
+                # Check the limit before appending so limit=0 yields
+                # nothing, matching the recursive version.
+                if limit is not None and len(results) >= limit:
+                    break
+                # Interned so the cache and repeated queries share one
+                # canonical object per word.
+                results.append(sys.intern(buf[:depth].decode("utf-8")))
+            for c2, child in reversed(children[n].items()):
+                stack.append((child, depth + 1, c2))
+
+        # Cache an immutable copy so callers can mutate the returned list.
+        self._prefix_cache[key] = tuple(results)
+        if len(self._prefix_cache) > self._CACHE_MAX:
+            self._prefix_cache.popitem(last=False)
         return results
 
     def delete(self, word: str) -> bool:
@@ -92,52 +225,251 @@ class Trie:
         Time: O(m)
         """
 
-        def _delete(node: TrieNode, depth: int) -> bool:
-            if depth == len(word):
-                if not node.is_end:
+        data = word.encode("utf-8")
+        found = False
+
+        def _delete(node: int, depth: int) -> bool:
+            nonlocal found
+            if depth == len(data):
+                if not self._is_end[node]:
                     return False
-                node.is_end = False
+                found = True
+                self._is_end[node] = 0
                 self._size -= 1
+                self._subtree[node] -= 1
                 # True = prune this node (no children and not end)
-                return len(node.children) == 0
+                return len(self._children[node]) == 0
 
-            ch = word[depth]
-            child = node.children.get(ch)
+            c = data[depth]
+            child = self._children[node].get(c)
             if child is None:
                 return False
 
             should_prune = _delete(child, depth + 1)
+            # Every ancestor is visited on the unwind, so the subtree
+            # counters are maintained here.
+            if found:
+                self._subtree[node] -= 1
             if should_prune:
-                del node.children[ch]
-                return (not node.is_end) and (len(node.children) == 0)
+                del self._children[node][c]
+                self._free.append(child)
+                return (not self._is_end[node]) and (len(self._children[node]) == 0)
 
             return False
 
         if not word:
             return False
 
-        existed = self.search(word)
-        _delete(self._root, 0)
-        return existed
+        # The walk itself reports existence via `found`; no separate
+        # search() pre-scan is needed.
+        _delete(0, 0)
+        if found:
+            self._version += 1
+        return found
 
     def count_prefix(self, prefix: str) -> int:
         """Count how many stored words start with the prefix.
-        Time: O(p + T)
+        Answered from the per-node subtree counters: no subtree walk.
+        Time: O(p)
         """
         node = self._traverse(prefix)
         if node is None:
             return 0
+        return self._subtree[node]
 
-        count = 0
+    def freeze(self) -> "FrozenTrie":
+        """Build a read-only FrozenTrie (double-array) snapshot.
+        Time: O(total nodes) amortized
+        """
+        base = array("i", [0])
+        check = array("i", [-1])
+        is_end = bytearray([self._is_end[0]])
+
+        def ensure(n: int) -> None:
+            while len(check) <= n:
+                base.append(0)
+                check.append(-1)
+                is_end.append(0)
+
+        # Breadth-first placement (Aoe's construction): for each node pick
+        # a base b so every child slot b + c + 1 is still free.
+        queue = deque([(0, 0)])  # (trie node id, DAT state)
+        hint = 1  # lowest possibly-free slot, advances monotonically
+        while queue:
+            node, s = queue.popleft()
+            items = sorted(self._children[node].items())
+            if not items:
+                continue
+            b = hint
+            while True:
+                if all(
+                    b + c + 1 >= len(check) or check[b + c + 1] == -1
+                    for c, _ in items
+                ):
+                    break
+                b += 1
+            base[s] = b
+            for c, child in items:
+                t = b + c + 1
+                ensure(t)
+                check[t] = s
+                is_end[t] = self._is_end[child]
+                queue.append((child, t))
+            while hint < len(check) and check[hint] != -1:
+                hint += 1
+        return FrozenTrie(base, check, is_end, self._size, self._max_len)
 
-        def dfs(n: TrieNode) -> None:
-            nonlocal count
-            if n.is_end:
-                count += 1
-            for child in n.children.values():
-                dfs(child)
+    def size(self) -> int:
+        """Return number of stored words."""
+        return self._size
+
+    def is_empty(self) -> bool:
+        """Return True if Trie contains no words."""
+        return self._size == 0
+
+    # Pythonic convenience
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: str) -> bool:
+        return self.search(word)
+
+    # ------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------
+
+    def _new_node(self) -> int:
+        """Allocate a node id, reusing a pruned one when available."""
+        if self._free:
+            nid = self._free.pop()
+            self._children[nid] = {}
+            self._is_end[nid] = 0
+            self._subtree[nid] = 0
+            return nid
+        self._children.append({})
+        self._is_end.append(0)
+        self._subtree.append(0)
+        return len(self._children) - 1
+
+    def _traverse(self, string: str) -> Optional[int]:
+        """Return the node id at the end of string traversal."""
+        # Rebind the children table to a local: the loop then does one
+        # subscript per step instead of an attribute lookup per step.
+        children = self._children
+        node = 0
+        for c in string.encode("utf-8"):
+            nxt = children[node].get(c)
+            if nxt is None:
+                return None
+            node = nxt
+        return node
 
-        dfs(node)
+
+class FrozenTrie:
+    """
+    Read-only snapshot of a Trie stored as a double-array trie.
+
+    A transition on byte c from state s resolves as t = base[s] + c + 1,
+    valid when check[t] == s — one integer add and one bounds check per
+    byte, with no hashing. Supports the read side of the Trie API
+    (search, starts_with, get_words_with_prefix, count_prefix, size).
+    Build one with Trie.freeze().
+    """
+
+    def __init__(
+        self,
+        base: array,
+        check: array,
+        is_end: bytearray,
+        size: int,
+        max_len: int = 0,
+    ) -> None:
+        self._base = base
+        self._check = check
+        self._is_end = is_end
+        self._size = size
+        self._max_len = max_len  # upper bound on encoded word length
+        if numba is not None:
+            # ndarray views over the same buffers for the jitted walk
+            self._base_np = numpy.frombuffer(base, dtype=numpy.intc)
+            self._check_np = numpy.frombuffer(check, dtype=numpy.intc)
+
+    def search(self, word: str) -> bool:
+        """Return True if the word exists as a complete word.
+        Time: O(m)
+        """
+        s = self._walk(word)
+        return s is not None and self._is_end[s] == 1
+
+    def starts_with(self, prefix: str) -> bool:
+        """Return True if any stored word begins with the prefix.
+        Time: O(p)
+        """
+        return self._walk(prefix) is not None
+
+    def get_words_with_prefix(
+        self, prefix: str, limit: Optional[int] = None
+    ) -> List[str]:
+        """Return words beginning with prefix. Stops at limit if provided.
+        Time: O(p + k·L')
+        """
+        start = self._walk(prefix)
+        if start is None:
+            return []
+
+        base = self._base
+        check = self._check
+        is_end = self._is_end
+        n_states = len(check)
+
+        results: List[str] = []
+        encoded = prefix.encode("utf-8")
+        buf = bytearray(max(self._max_len, len(encoded), 1))
+        buf[:len(encoded)] = encoded
+        stack: List[tuple] = [(start, len(encoded), None)]
+        while stack:
+            s, depth, c = stack.pop()
+            if c is not None:
+                buf[depth - 1] = c
+            if is_end[s]:
+                # Limit first, append second — limit=0 yields nothing,
+                # matching Trie.get_words_with_prefix.
+                if limit is not None and len(results) >= limit:
+                    break
+                results.append(sys.intern(buf[:depth].decode("utf-8")))
+            # Children are found by probing every byte value; slots whose
+            # check points back at s are transitions out of s.
+            b = base[s]
+            for c2 in range(255, -1, -1):
+                t = b + c2 + 1
+                if t < n_states and check[t] == s:
+                    stack.append((t, depth + 1, c2))
+        return results
+
+    def count_prefix(self, prefix: str) -> int:
+        """Count how many stored words start with the prefix.
+        Time: O(p + T)
+        """
+        start = self._walk(prefix)
+        if start is None:
+            return 0
+
+        base = self._base
+        check = self._check
+        is_end = self._is_end
+        n_states = len(check)
+
+        count = 0
+        stack = [start]
+        while stack:
+            s = stack.pop()
+            if is_end[s]:
+                count += 1
+            b = base[s]
+            for c in range(256):
+                t = b + c + 1
+                if t < n_states and check[t] == s:
+                    stack.append(t)
         return count
 
     def size(self) -> int:
@@ -145,7 +477,7 @@ class Trie:
         return self._size
 
     def is_empty(self) -> bool:
-        """Return True if Trie contains no words."""
+        """Return True if the snapshot contains no words."""
         return self._size == 0
 
     # Pythonic convenience
@@ -156,14 +488,27 @@ class Trie:
         return self.search(word)
 
     # ------------------------------------------------------
-    # Internal helper
+    # Internal helpers
     # ------------------------------------------------------
 
-    def _traverse(self, string: str) -> Optional[TrieNode]:
-        """Return the node at the end of string traversal."""
-        node = self._root
-        for ch in string:
-            node = node.children.get(ch)
-            if node is None:
+    def _walk(self, string: str) -> Optional[int]:
+        """Return the state at the end of string traversal."""
+        data = string.encode("utf-8")
+        if numba is not None:
+            s = _walk_dat(
+                self._base_np,
+                self._check_np,
+                numpy.frombuffer(data, dtype=numpy.uint8),
+            )
+            return None if s < 0 else s
+
+        base = self._base
+        check = self._check
+        n_states = len(check)
+        s = 0
+        for c in data:
+            t = base[s] + c + 1
+            if t >= n_states or check[t] != s:
                 return None
-        return node
+            s = t
+        return s
@@ -0,0 +1,70 @@
+from src.compact_trie import CompactTrie
+
+
+def test_insert_and_search():
+    t = CompactTrie()
+    t.insert("cat")
+    t.insert("car")
+    t.insert("dog")
+
+    assert t.search("cat")
+    assert t.search("car")
+    assert t.search("dog")
+    assert not t.search("ca")
+    assert not t.search("do")
+    assert not t.search("cow")
+    assert len(t) == 3
+
+
+def test_split_and_prefix():
+    t = CompactTrie()
+    words = ["apple", "application", "applied", "apt", "bat"]
+    for w in words:
+        t.insert(w)
+
+    assert t.starts_with("app")
+    assert t.starts_with("ap")
+    assert not t.starts_with("az")
+
+    prefix_words = t.get_words_with_prefix("app")
+    assert prefix_words == ["apple", "application", "applied"]
+    assert "apt" not in prefix_words  # different prefix
+
+    assert len(t.get_words_with_prefix("app", limit=2)) == 2
+    assert t.get_words_with_prefix("app", limit=0) == []
+
+    # word ending inside a collapsed label is still only a prefix
+    assert not t.search("appl")
+    t.insert("appl")
+    assert t.search("appl")
+
+
+def test_delete_with_merge():
+    t = CompactTrie()
+    t.insert("car")
+    t.insert("card")
+    t.insert("care")
+
+    assert t.delete("card")
+    assert not t.search("card")
+    assert t.search("car")
+    assert t.search("care")
+
+    # deleting a non-existent word should return False
+    assert not t.delete("cart")
+
+    assert t.delete("car")
+    assert t.search("care")
+    assert len(t) == 1
+
+
+def test_count_prefix():
+    t = CompactTrie()
+    words = ["cat", "car", "cart", "dog"]
+    for w in words:
+        t.insert(w)
+
+    assert t.count_prefix("ca") == 3
+    assert t.count_prefix("car") == 2
+    assert t.count_prefix("cart") == 1
+    assert t.count_prefix("z") == 0
@@ -0,0 +1,79 @@
+import pytest
+
+from src.hat_trie import HatTrie
+
+
+def test_insert_and_search():
+    t = HatTrie()
+    t.insert("cat")
+    t.insert("car")
+    t.insert("dog")
+
+    assert t.search("cat")
+    assert t.search("car")
+    assert t.search("dog")
+    assert not t.search("ca")
+    assert not t.search("cow")
+    assert len(t) == 3
+
+
+def test_bursting_preserves_contents():
+    # A tiny threshold forces buckets to burst into real child nodes.
+    t = HatTrie(burst_threshold=2)
+    words = ["apple", "application", "applied", "apply", "apt", "bat", "app"]
+    for w in words:
+        t.insert(w)
+
+    for w in words:
+        assert t.search(w), w
+    assert not t.search("appl")
+    assert sorted(t.get_words_with_prefix("app")) == [
+        "app", "apple", "application", "applied", "apply",
+    ]
+    assert t.count_prefix("ap") == 6
+    assert t.count_prefix("appl") == 4
+
+
+def test_prefix_inside_bucket():
+    t = HatTrie(burst_threshold=16)
+    t.insert("bandwidth")
+    t.insert("bandit")
+
+    # both words live as suffixes in the root bucket
+    assert t.starts_with("band")
+    assert sorted(t.get_words_with_prefix("band")) == ["bandit", "bandwidth"]
+    assert t.count_prefix("bandw") == 1
+
+
+def test_delete():
+    t = HatTrie(burst_threshold=2)
+    words = ["car", "card", "care", "cart", "dog"]
+    for w in words:
+        t.insert(w)
+
+    assert t.delete("card")
+    assert not t.search("card")
+    assert t.search("car")
+    assert t.search("care")
+    assert not t.delete("cards")
+    assert len(t) == 4
+
+
+def test_delete_prunes_bucket_only_path():
+    t = HatTrie(burst_threshold=2)
+    t.insert("abc")
+    t.insert("abd")
+    t.insert("xyz")
+
+    # "xyz" lives as a suffix in a bucket below the 'x' node; deleting
+    # it must prune the emptied path, not just the bucket entry.
+    assert t.delete("xyz")
+    assert not t.starts_with("x")
+    assert t.get_words_with_prefix("x") == []
+    assert t.count_prefix("x") == 0
+    assert t.starts_with("ab")  # untouched words keep their path
+
+
+def test_invalid_threshold():
+    with pytest.raises(ValueError):
+        HatTrie(burst_threshold=0)
@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("marisa_trie")
+
+from src.marisa_backend import MarisaTrie
+
+
+def test_queries():
+    t = MarisaTrie(["app", "apple", "application", "apt", "bat"])
+
+    assert t.search("apple")
+    assert not t.search("ap")
+    assert t.starts_with("appl")
+    assert not t.starts_with("az")
+    assert t.get_words_with_prefix("app") == ["app", "apple", "application"]
+    assert t.get_words_with_prefix("app", limit=2) == ["app", "apple"]
+    assert t.count_prefix("ap") == 4
+    assert len(t) == 5
+    assert "bat" in t
+
+
+def test_read_only():
+    t = MarisaTrie(["cat"])
+
+    with pytest.raises(NotImplementedError):
+        t.insert("dog")
+    with pytest.raises(NotImplementedError):
+        t.delete("cat")
+
+    # the supported mutation path is a full rebuild
+    t.insert_batch(["dog"])
+    assert t.search("cat")
+    assert t.search("dog")
+    assert len(t) == 2
@@ -32,6 +32,9 @@ def test_starts_with_and_prefix():
     assert "applied" in prefix_words
     assert "apt" not in prefix_words  # different prefix
 
+    assert len(t.get_words_with_prefix("app", limit=2)) == 2
+    assert t.get_words_with_prefix("app", limit=0) == []
+
 
 def test_delete():
     t = Trie()
@@ -52,6 +55,25 @@ def test_delete():
     assert not t.delete("cart")
 
 
+def test_insert_returning_new():
+    t = Trie()
+    assert t.insert_returning_new("cat")
+    assert not t.insert_returning_new("cat")
+    assert t.insert_returning_new("ca")
+    assert not t.insert_returning_new("")
+    assert len(t) == 2
+
+
+def test_insert_many():
+    t = Trie()
+    processed = t.insert_many(b"cat\ncar\n\ncat\n".split(b"\n"))
+
+    assert processed == 3  # duplicates counted, empty lines skipped
+    assert len(t) == 2
+    assert t.search("cat")
+    assert t.search("car")
+
+
 def test_count_prefix():
     t = Trie()
     words = ["cat", "car", "cart", "dog"]
@@ -62,3 +84,61 @@ def test_count_prefix():
     assert t.count_prefix("car") == 2
     assert t.count_prefix("cart") == 1
     assert t.count_prefix("z") == 0
+
+
+def test_query_cache_invalidation():
+    t = Trie()
+    t.insert("cat")
+    t.insert("car")
+
+    assert t.get_words_with_prefix("ca") == t.get_words_with_prefix("ca")
+    assert t.count_prefix("ca") == 2
+
+    # mutations must invalidate cached answers
+    t.insert("cab")
+    assert sorted(t.get_words_with_prefix("ca")) == ["cab", "car", "cat"]
+    assert t.count_prefix("ca") == 3
+
+    t.delete("cab")
+    assert sorted(t.get_words_with_prefix("ca")) == ["car", "cat"]
+    assert t.count_prefix("ca") == 2
+
+    # mutating a returned list must not poison the cache
+    t.get_words_with_prefix("ca").append("bogus")
+    assert "bogus" not in t.get_words_with_prefix("ca")
+
+
+def test_finalize_sort_orders_results():
+    t = Trie()
+    for w in ["apt", "apple", "bat", "application", "app", "applied"]:
+        t.insert(w)
+
+    t.finalize_sort()
+    assert t.get_words_with_prefix("app") == [
+        "app", "apple", "application", "applied",
+    ]
+    # queries still work for words added after the sorting pass
+    t.insert("apricot")
+    assert t.search("apricot")
+    assert "apricot" in t.get_words_with_prefix("ap")
+
+
+def test_freeze():
+    t = Trie()
+    words = ["app", "apple", "application", "apt", "bat"]
+    for w in words:
+        t.insert(w)
+
+    frozen = t.freeze()
+    for w in words:
+        assert frozen.search(w)
+    assert not frozen.search("ap")
+    assert frozen.starts_with("appl")
+    assert not frozen.starts_with("az")
+    assert sorted(frozen.get_words_with_prefix("app")) == [
+        "app", "apple", "application",
+    ]
+    assert len(frozen.get_words_with_prefix("app", limit=2)) == 2
+    assert frozen.get_words_with_prefix("app", limit=0) == []
+    assert frozen.count_prefix("ap") == 4
+    assert len(frozen) == len(t)